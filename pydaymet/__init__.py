@@ -1,23 +1,52 @@
 """Top-level package for PyDaymet."""
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from pkg_resources import DistributionNotFound, get_distribution
 
 from .core import Daymet
 from .exceptions import InvalidInputRange, InvalidInputType, InvalidInputValue, MissingItems
-from .pet import potential_et
 from .print_versions import show_versions
-from .pydaymet import get_bycoords, get_bygeom, get_byloc
+
+if TYPE_CHECKING:
+    from .pet import potential_et, potential_et_bycoords
+    from .pydaymet import get_bycoords, get_bygeom, get_byloc
 
 try:
     __version__ = get_distribution(__name__).version
 except DistributionNotFound:
     __version__ = "999"
 
+# These are imported on first access since their modules pull in
+# heavy dependencies such as py3dep, pygeoutils, and async_retriever.
+_LAZY_IMPORTS = {
+    "get_bycoords": ".pydaymet",
+    "get_bygeom": ".pydaymet",
+    "get_byloc": ".pydaymet",
+    "potential_et": ".pet",
+    "potential_et_bycoords": ".pet",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        obj = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     "Daymet",
     "get_bycoords",
     "get_bygeom",
     "get_byloc",
     "potential_et",
+    "potential_et_bycoords",
     "show_versions",
     "InvalidInputRange",
     "InvalidInputType",
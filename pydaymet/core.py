@@ -1,6 +1,7 @@
 """Core class for the Daymet functions."""
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import shapely.geometry as sgeom
 from pydantic import BaseModel, validator
@@ -9,9 +10,42 @@ from .exceptions import InvalidInputRange, InvalidInputType, InvalidInputValue
 
 DEF_CRS = "epsg:4326"
 DATE_FMT = "%Y-%m-%d"
-
-
-__all__ = ["Daymet"]
+UNITS = {
+    "dayl": "s/day",
+    "prcp": "mm/day",
+    "srad": "W/m2",
+    "swe": "kg/m2",
+    "tmax": "degrees C",
+    "tmin": "degrees C",
+    "vp": "Pa",
+}
+VALID_VARIABLES = tuple(UNITS)
+DESCRIPTIONS = {
+    "dayl": "Duration of the daylight period in seconds per day. "
+    + "This calculation is based on the period of the day during which the "
+    + "sun is above a hypothetical flat horizon",
+    "prcp": "Daily total precipitation in millimeters per day, sum of"
+    + " all forms converted to water-equivalent. Precipitation occurrence on "
+    + "any given day may be ascertained.",
+    "srad": "Incident shortwave radiation flux density in watts per square meter, "
+    + "taken as an average over the daylight period of the day. "
+    + "NOTE: Daily total radiation (MJ/m2/day) can be calculated as follows: "
+    + "((srad (W/m2) * dayl (s/day)) / 1,000,000)",
+    "swe": "Snow water equivalent in kilograms per square meter."
+    + " The amount of water contained within the snowpack.",
+    "tmax": "Daily maximum 2-meter air temperature in degrees Celsius.",
+    "tmin": "Daily minimum 2-meter air temperature in degrees Celsius.",
+    "vp": "Water vapor pressure in pascals. Daily average partial pressure of water vapor.",
+}
+VALID_START = {
+    "na": pd.Timestamp("1980-01-01"),
+    "hi": pd.Timestamp("1980-01-01"),
+    "pr": pd.Timestamp("1950-01-01"),
+}
+VALID_END = pd.Timestamp("2020-12-31")
+
+
+__all__ = ["Daymet", "UNITS", "DESCRIPTIONS"]
 
 
 class DaymetBase(BaseModel):
@@ -46,7 +80,7 @@ class DaymetBase(BaseModel):
 
     @validator("variables")
     def _valid_variables(cls, v, values) -> List[str]:
-        valid_variables = ["dayl", "prcp", "srad", "swe", "tmax", "tmin", "vp"]
+        valid_variables = list(VALID_VARIABLES)
         if "all" in v:
             return valid_variables
 
@@ -56,7 +90,7 @@ class DaymetBase(BaseModel):
             raise InvalidInputValue("variables", valid_variables)
 
         if values["pet"]:
-            variables = list({"tmin", "tmax", "srad", "dayl"} | set(variables))
+            variables = list(dict.fromkeys((*variables, "tmin", "tmax", "srad", "dayl")))
         return variables
 
     @validator("time_scale")
@@ -130,50 +164,15 @@ class Daymet:
                 f"Valid bounding box is: {self.region_bbox[region].bounds}",
             ]
         )
-        if self.region == "pr":
-            self.valid_start = pd.to_datetime("1950-01-01")
-        else:
-            self.valid_start = pd.to_datetime("1980-01-01")
-        self.valid_end = pd.to_datetime("2020-12-31")
+        self.valid_start = VALID_START[self.region]
+        self.valid_end = VALID_END
         self._invalid_yr = (
             "Daymet database ranges from " + f"{self.valid_start.year} to {self.valid_end.year}."
         )
         self.time_codes = {"daily": 1840, "monthly": 1855, "annual": 1852}
 
-        self.daymet_table = pd.DataFrame(
-            {
-                "Parameter": [
-                    "Day length",
-                    "Precipitation",
-                    "Shortwave radiation",
-                    "Snow water equivalent",
-                    "Maximum air temperature",
-                    "Minimum air temperature",
-                    "Water vapor pressure",
-                ],
-                "Abbr": ["dayl", "prcp", "srad", "swe", "tmax", "tmin", "vp"],
-                "Units": ["s/day", "mm/day", "W/m2", "kg/m2", "degrees C", "degrees C", "Pa"],
-                "Description": [
-                    "Duration of the daylight period in seconds per day. "
-                    + "This calculation is based on the period of the day during which the "
-                    + "sun is above a hypothetical flat horizon",
-                    "Daily total precipitation in millimeters per day, sum of"
-                    + " all forms converted to water-equivalent. Precipitation occurrence on "
-                    + "any given day may be ascertained.",
-                    "Incident shortwave radiation flux density in watts per square meter, "
-                    + "taken as an average over the daylight period of the day. "
-                    + "NOTE: Daily total radiation (MJ/m2/day) can be calculated as follows: "
-                    + "((srad (W/m2) * dayl (s/day)) / l,000,000)",
-                    "Snow water equivalent in kilograms per square meter."
-                    + " The amount of water contained within the snowpack.",
-                    "Daily maximum 2-meter air temperature in degrees Celsius.",
-                    "Daily minimum 2-meter air temperature in degrees Celsius.",
-                    "Water vapor pressure in pascals. Daily average partial pressure of water vapor.",
-                ],
-            }
-        )
-
-        self.units = dict(zip(self.daymet_table["Abbr"], self.daymet_table["Units"]))
+        self.units = dict(UNITS)
+        self.valid_variables = list(VALID_VARIABLES)
 
     @staticmethod
     def check_dates(dates: Union[Tuple[str, str], Union[int, List[int]]]) -> None:
@@ -193,16 +192,12 @@ class Daymet:
         if not isinstance(dates, tuple) or len(dates) != 2:
             raise InvalidInputType("dates", "tuple", "(start, end)")
 
-        start = pd.to_datetime(dates[0])
-        end = pd.to_datetime(dates[1])
+        start, end = (pd.Timestamp(d) for d in dates)
 
         if start < self.valid_start or end > self.valid_end:
             raise InvalidInputRange(self._invalid_yr)
 
-        return {
-            "start": start.strftime(DATE_FMT),
-            "end": end.strftime(DATE_FMT),
-        }
+        return {"start": start.strftime(DATE_FMT), "end": end.strftime(DATE_FMT)}
 
     def years_todict(self, years: Union[List[int], int]) -> Dict[str, str]:
         """Set date by list of year(s)."""
@@ -232,15 +227,20 @@ class Daymet:
             All the dates in the Daymet database within the provided date range.
         """
         date_dict = self.dates_todict(dates)
-        start = pd.to_datetime(date_dict["start"]) + pd.DateOffset(hour=12)
-        end = pd.to_datetime(date_dict["end"]) + pd.DateOffset(hour=12)
+        start = pd.to_datetime(date_dict["start"]) + pd.Timedelta(hours=12)
+        end = pd.to_datetime(date_dict["end"]) + pd.Timedelta(hours=12)
 
         period = pd.date_range(start, end)
-        nl = period[~period.is_leap_year]
-        lp = period[(period.is_leap_year) & (~period.strftime(DATE_FMT).str.endswith("12-31"))]
-        _period = period[(period.isin(nl)) | (period.isin(lp))]
-        years = [_period[_period.year == y] for y in _period.year.unique()]
-        return [(y[0], y[-1]) for y in years]
+        dec31 = (period.month.to_numpy() == 12) & (period.day.to_numpy() == 31)
+        _period = period[~(dec31 & period.is_leap_year)]
+        if _period.empty:
+            return []
+
+        yrs = _period.year.to_numpy()
+        edges = np.flatnonzero(np.diff(yrs)) + 1
+        starts = np.concatenate(([0], edges))
+        ends = np.concatenate((edges, [len(yrs)])) - 1
+        return [(_period[s], _period[e]) for s, e in zip(starts, ends)]
 
     def years_tolist(
         self, years: Union[List[int], int]
@@ -261,10 +261,8 @@ class Daymet:
             All the dates in the Daymet database within the provided date range.
         """
         date_dict = self.years_todict(years)
-        start_list, end_list = [], []
-        for year in date_dict["years"].split(","):
-            s = pd.to_datetime(f"{year}0101")
-            start_list.append(s + pd.DateOffset(hour=12))
-            e = pd.to_datetime(f"{year}1230") if s.is_leap_year else pd.to_datetime(f"{year}1231")
-            end_list.append(e + pd.DateOffset(hour=12))
-        return list(zip(start_list, end_list))
+        yrs = np.array(date_dict["years"].split(","), dtype=np.int64)
+        starts = pd.to_datetime(yrs * 10000 + 101, format="%Y%m%d")
+        end_day = np.where(starts.is_leap_year, 1230, 1231)
+        ends = pd.to_datetime(yrs * 10000 + end_day, format="%Y%m%d")
+        return list(zip(starts + pd.Timedelta(hours=12), ends + pd.Timedelta(hours=12)))
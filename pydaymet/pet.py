@@ -1,18 +1,19 @@
 """Core class for the Daymet functions."""
+import functools
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import py3dep
 import xarray as xr
+from pygeoogc import ServiceError
 
-from .exceptions import InvalidInputType, InvalidInputValue, MissingItems
+from .exceptions import InvalidInputRange, InvalidInputType, InvalidInputValue, MissingItems
 
 DEF_CRS = "epsg:4326"
 
 
-__all__ = ["potential_et"]
+__all__ = ["potential_et", "potential_et_bycoords"]
 
 
 def potential_et(
@@ -21,6 +22,7 @@ def potential_et(
     crs: str = "epsg:4326",
     alt_unit: bool = False,
     method: str = "fao56",
+    elevation: Optional[float] = None,
 ) -> Union[pd.DataFrame, xr.Dataset]:
     """Compute Potential EvapoTranspiration for both gridded and a single location.
 
@@ -70,6 +72,9 @@ def potential_et(
         Method for computing PET. At the moment only ``fao56`` is supported which is based on
         `FAO Penman-Monteith equation <http://www.fao.org/3/X0490E/x0490e06.htm>`__ assuming that
         soil heat flux density is zero.
+    elevation : float, optional
+        Elevation of the location in meters. This is only used when ``clm`` is a ``DataFrame``
+        and if not given, it's retrieved from the 3DEP service. Defaults to None.
 
     Returns
     -------
@@ -89,13 +94,71 @@ def potential_et(
         if coords is None:
             raise MissingItems(["coords"])
 
-        pet = PETCoords(clm, coords, crs, alt_unit)
+        pet = PETCoords(clm, coords, crs, alt_unit, elevation)
     else:
         pet = PETGridded(clm)
 
     return getattr(pet, method)()
 
 
+def potential_et_bycoords(
+    clm_list: List[pd.DataFrame],
+    coords_list: List[Tuple[float, float]],
+    crs: str = DEF_CRS,
+    alt_unit: bool = False,
+    method: str = "fao56",
+) -> List[pd.DataFrame]:
+    """Compute Potential EvapoTranspiration for multiple locations.
+
+    Notes
+    -----
+    The elevations of all the locations are retrieved with a single request
+    to the 3DEP service instead of one request per location.
+
+    Parameters
+    ----------
+    clm_list : list of pandas.DataFrame
+        A list of single-location climate data, see ``potential_et`` for
+        the required variables.
+    coords_list : list of tuples
+        Coordinates of the locations as a list of (x, y) tuples, with the same
+        order as ``clm_list``.
+    crs : str, optional
+        The spatial reference of the input coordinates, defaults to ``epsg:4326``.
+    alt_unit : str, optional
+        Whether to use alternative units rather than the official ones, defaults to False.
+    method : str, optional
+        Method for computing PET, defaults to ``fao56``.
+
+    Returns
+    -------
+    list of pandas.DataFrame
+        The input DataFrames with an additional column named ``pet (mm/day)``.
+    """
+    valid_methods = ["fao56"]
+    if method not in valid_methods:
+        raise InvalidInputValue("method", valid_methods)
+
+    if not all(isinstance(clm, pd.DataFrame) for clm in clm_list):
+        raise InvalidInputType("clm_list", "list of pd.DataFrame")
+
+    if len(clm_list) != len(coords_list):
+        raise InvalidInputRange("clm_list and coords_list should have the same length.")
+
+    if not clm_list:
+        return []
+
+    elevations = _elevation_bycoords(tuple(tuple(c) for c in coords_list), crs)
+    if len(elevations) != len(coords_list):
+        raise ServiceError(
+            f"3DEP returned {len(elevations)} elevations for {len(coords_list)} coordinates."
+        )
+    return [
+        potential_et(clm, coords, crs, alt_unit, method, elev)
+        for clm, coords, elev in zip(clm_list, coords_list, elevations)
+    ]
+
+
 @dataclass
 class PETCoords:
     """Compute Potential EvapoTranspiration for a single location.
@@ -121,12 +184,16 @@ class PETCoords:
         The spatial reference of the input coordinate, defaults to epsg:4326.
     alt_unit : str, optional
         Whether to use alternative units rather than the official ones, defaults to False.
+    elevation : float, optional
+        Elevation of the location in meters. If not given, it's retrieved from
+        the 3DEP service. Defaults to None.
     """
 
     clm: pd.DataFrame
     coords: Tuple[float, float]
     crs: str = DEF_CRS
     alt_unit: bool = False
+    elevation: Optional[float] = None
 
     def fao56(self) -> pd.DataFrame:
         """Compute Potential EvapoTranspiration using FAO56 for a single location.
@@ -151,7 +218,6 @@ class PETCoords:
         tmax_c = f"tmax ({units['temp'][self.alt_unit]})"
         srad_wm2 = f"srad ({units['srad'][self.alt_unit]})"
         dayl_s = "dayl (s)"
-        tmean_c = "tmean (deg c)"
         rh = "rh (-)"
         u2 = "u2 (m/s)"
 
@@ -159,34 +225,27 @@ class PETCoords:
 
         _check_requirements(reqs, self.clm.columns)
 
-        self.clm[tmean_c] = 0.5 * (self.clm[tmax_c] + self.clm[tmin_c])
-        delta_v = (
-            4098
-            * (
-                0.6108
-                * np.exp(
-                    17.27 * self.clm[tmean_c] / (self.clm[tmean_c] + 237.3),
-                )
-            )
-            / ((self.clm[tmean_c] + 237.3) ** 2)
-        )
-        elevation = py3dep.elevation_bycoords([self.coords], self.crs, source="tnm")[0]
+        tmax = self.clm[tmax_c].to_numpy("f8")
+        tmin = self.clm[tmin_c].to_numpy("f8")
+        tmean, delta_v, e_max, e_min = _vapour_pressure(tmax, tmin)
+        if self.elevation is None:
+            elevation = _elevation_bycoords((tuple(self.coords),), self.crs)[0]
+        else:
+            elevation = self.elevation
 
         # Atmospheric pressure [kPa]
         pa = 101.3 * ((293.0 - 0.0065 * elevation) / 293.0) ** 5.26
         # Latent Heat of Vaporization [MJ/kg]
-        lmbda = 2.501 - 0.002361 * self.clm[tmean_c]
+        lmbda = 2.501 - 0.002361 * tmean
         # Psychrometric constant [kPa/°C]
         gamma = 1.013e-3 * pa / (0.622 * lmbda)
 
-        e_max = 0.6108 * np.exp(17.27 * self.clm[tmax_c] / (self.clm[tmax_c] + 237.3))
-        e_min = 0.6108 * np.exp(17.27 * self.clm[tmin_c] / (self.clm[tmin_c] + 237.3))
         e_s = (e_max + e_min) * 0.5
-        e_a = self.clm[rh] * e_s * 1e-2 if rh in self.clm else e_min
+        e_a = self.clm[rh].to_numpy("f8") * e_s * 1e-2 if rh in self.clm else e_min
         e_def = e_s - e_a
 
-        jday = self.clm.index.dayofyear
-        r_surf = self.clm[srad_wm2] * self.clm[dayl_s] * 1e-6
+        jday = self.clm.index.dayofyear.to_numpy()
+        r_surf = self.clm[srad_wm2].to_numpy("f8") * self.clm[dayl_s].to_numpy("f8") * 1e-6
 
         alb = 0.23
 
@@ -207,7 +266,7 @@ class PETCoords:
         rad_ns = (1.0 - alb) * r_surf
         rad_nl = (
             4.903e-9
-            * (((self.clm[tmax_c] + 273.16) ** 4 + (self.clm[tmin_c] + 273.16) ** 4) * 0.5)
+            * _mean_kelvin4(tmax, tmin)
             * (0.34 - 0.14 * np.sqrt(e_a))
             * ((1.35 * r_surf / rad_s) - 0.35)
         )
@@ -216,13 +275,10 @@ class PETCoords:
         # recommended for daily data
         rho_s = 0.0
         # recommended when no data is available
-        u_2m = self.clm[u2] if u2 in self.clm else 2.0
+        u_2m = self.clm[u2].to_numpy("f8") if u2 in self.clm else 2.0
         self.clm["pet (mm/day)"] = (
-            0.408 * delta_v * (rad_n - rho_s)
-            + gamma * 900.0 / (self.clm[tmean_c] + 273.0) * u_2m * e_def
+            0.408 * delta_v * (rad_n - rho_s) + gamma * 900.0 / (tmean + 273.0) * u_2m * e_def
         ) / (delta_v + gamma * (1 + 0.34 * u_2m))
-
-        self.clm = self.clm.drop(columns=tmean_c)
         return self.clm
 
 
@@ -252,6 +308,10 @@ class PETGridded:
         `FAO Penman-Monteith equation <http://www.fao.org/3/X0490E/x0490e06.htm>`__
         assuming that soil heat flux density is zero.
 
+        If the input dataset is backed by Dask arrays, e.g., chunked along
+        ``time``, ``y``, or ``x``, the computation is lazy and is carried
+        out chunk by chunk when the returned ``pet`` is computed.
+
         Returns
         -------
         xarray.Dataset
@@ -263,97 +323,205 @@ class PETGridded:
         _check_requirements(reqs, keys)
 
         dtype = self.clm.tmin.dtype
-        dates = self.clm["time"]
-        self.clm["tmean"] = 0.5 * (self.clm["tmax"] + self.clm["tmin"])
-
-        # Slope of saturation vapour pressure [kPa/°C]
-        self.clm["delta_r"] = (
-            4098
-            * (0.6108 * np.exp(17.27 * self.clm["tmean"] / (self.clm["tmean"] + 237.3)))
-            / ((self.clm["tmean"] + 237.3) ** 2)
-        )
 
         res = self.clm.res[0] * 1.0e3
-        elev = py3dep.elevation_bygrid(self.clm.x.values, self.clm.y.values, self.clm.crs, res)
-        self.clm = xr.merge([self.clm, elev], combine_attrs="override")
-        self.clm["elevation"] = self.clm.elevation.where(
-            ~np.isnan(self.clm.isel(time=0)[keys[0]]), drop=True
+        elev = _elevation_bygrid(
+            self.clm.x.values.astype("f8").tobytes(),
+            self.clm.y.values.astype("f8").tobytes(),
+            self.clm.crs,
+            res,
+        )
+        elev = elev["elevation"] if isinstance(elev, xr.Dataset) else elev
+        self.clm = self.clm.assign(
+            elevation=elev.where(self.clm[keys[0]].isel(time=0, drop=True).notnull())
         )
 
-        # Atmospheric pressure [kPa]
-        pa = 101.3 * ((293.0 - 0.0065 * self.clm["elevation"]) / 293.0) ** 5.26
-        # Latent Heat of Vaporization [MJ/kg]
-        lmbda = 2.501 - 0.002361 * self.clm["tmean"]
-        # Psychrometric constant [kPa/°C]
-        self.clm["gamma"] = 1.013e-3 * pa / (0.622 * lmbda)
-
-        # Saturation vapor pressure [kPa]
-        e_max = 0.6108 * np.exp(17.27 * self.clm["tmax"] / (self.clm["tmax"] + 237.3))
-        e_min = 0.6108 * np.exp(17.27 * self.clm["tmin"] / (self.clm["tmin"] + 237.3))
-        e_s = (e_max + e_min) * 0.5
-
-        self.clm["e_a"] = self.clm["rh"] * e_s * 1e-2 if "rh" in keys else e_min
-        self.clm["e_def"] = e_s - self.clm["e_a"]
-
-        lat = self.clm.isel(time=0).lat
-        self.clm["time"] = pd.to_datetime(self.clm.time.values).dayofyear.astype(dtype)
-        r_surf = self.clm["srad"] * self.clm["dayl"] * 1e-6
-
-        alb = 0.23
+        lat = self.clm.isel(time=0, drop=True).lat
+        doy = self.clm["time"].dt.dayofyear.astype(dtype)
 
-        jp = 2.0 * np.pi * self.clm["time"] / 365.0
+        # These only depend on time or location, so they're computed
+        # before being broadcast to the full grid
+        jp = 2.0 * np.pi * doy / 365.0
         d_r = 1.0 + 0.033 * np.cos(jp)
         delta_r = 0.409 * np.sin(jp - 1.39)
         phi = lat * np.pi / 180.0
-        w_s = np.arccos(-np.tan(phi) * np.tan(delta_r))
-        r_aero = (
-            24.0
-            * 60.0
-            / np.pi
-            * 0.082
-            * d_r
-            * (w_s * np.sin(phi) * np.sin(delta_r) + np.cos(phi) * np.cos(delta_r) * np.sin(w_s))
-        )
-        rad_s = (0.75 + 2e-5 * self.clm["elevation"]) * r_aero
-        rad_ns = (1.0 - alb) * r_surf
-        rad_nl = (
-            4.903e-9
-            * (((self.clm["tmax"] + 273.16) ** 4 + (self.clm["tmin"] + 273.16) ** 4) * 0.5)
-            * (0.34 - 0.14 * np.sqrt(self.clm["e_a"]))
-            * ((1.35 * r_surf / rad_s) - 0.35)
-        )
-        self.clm["rad_n"] = rad_ns - rad_nl
 
-        # recommended for daily data
-        rho_s = 0.0
         # recommended when no data is available
         u_2m = self.clm["u2"] if "u2" in keys else 2.0
-        self.clm["pet"] = (
-            0.408 * self.clm["delta_r"] * (self.clm["rad_n"] - rho_s)
-            + self.clm["gamma"] * 900.0 / (self.clm["tmean"] + 273.0) * u_2m * self.clm["e_def"]
-        ) / (self.clm["delta_r"] + self.clm["gamma"] * (1 + 0.34 * u_2m))
+        args = [
+            self.clm["tmin"],
+            self.clm["tmax"],
+            self.clm["srad"],
+            self.clm["dayl"],
+            self.clm["elevation"],
+            phi,
+            d_r,
+            delta_r,
+            u_2m,
+        ]
+        if "rh" in keys:
+            args.append(self.clm["rh"])
+
+        # Keep the dtype that arithmetic on the inputs promotes to, e.g., float64 elevation
+        pet_dtype = np.result_type(*(a.dtype for a in args if isinstance(a, xr.DataArray)))
+        self.clm["pet"] = xr.apply_ufunc(
+            _fao56_grid,
+            *args,
+            kwargs={"dtype": pet_dtype},
+            dask="parallelized",
+            output_dtypes=[pet_dtype],
+        )
         self.clm["pet"].attrs["units"] = "mm/day"
 
-        self.clm["time"] = dates
+        return self.clm
 
-        self.clm = self.clm.drop_vars(["delta_r", "gamma", "e_def", "rad_n", "tmean", "e_a"])
 
-        return self.clm
+def _fao56_grid(
+    tmin: np.ndarray,
+    tmax: np.ndarray,
+    srad: np.ndarray,
+    dayl: np.ndarray,
+    elevation: np.ndarray,
+    phi: np.ndarray,
+    d_r: np.ndarray,
+    delta_r: np.ndarray,
+    u_2m: Union[np.ndarray, float],
+    rh: Optional[np.ndarray] = None,
+    dtype: np.dtype = np.dtype("f8"),
+) -> np.ndarray:
+    """Compute FAO56 PET in a single pass over broadcastable arrays.
+
+    All the intermediate terms are local to this function, so when it's called
+    through ``xarray.apply_ufunc`` they're computed chunk by chunk rather than
+    as full-size variables of the dataset.
+    """
+    tmean, delta_v, e_max, e_min = _vapour_pressure(tmax, tmin)
+
+    # Atmospheric pressure [kPa]
+    pa = 101.3 * ((293.0 - 0.0065 * elevation) / 293.0) ** 5.26
+    # Latent Heat of Vaporization [MJ/kg]
+    lmbda = 2.501 - 0.002361 * tmean
+    # Psychrometric constant [kPa/°C]
+    gamma = 1.013e-3 * pa / (0.622 * lmbda)
+
+    e_s = (e_max + e_min) * 0.5
+    e_a = e_min if rh is None else rh * e_s * 1e-2
+    e_def = e_s - e_a
+
+    r_surf = srad * dayl * 1e-6
+
+    alb = 0.23
+
+    w_s = np.arccos(-np.tan(phi) * np.tan(delta_r))
+    r_aero = (
+        24.0
+        * 60.0
+        / np.pi
+        * 0.082
+        * d_r
+        * (w_s * np.sin(phi) * np.sin(delta_r) + np.cos(phi) * np.cos(delta_r) * np.sin(w_s))
+    )
+    rad_s = (0.75 + 2e-5 * elevation) * r_aero
+    rad_ns = (1.0 - alb) * r_surf
+    rad_nl = (
+        4.903e-9
+        * _mean_kelvin4(tmax, tmin)
+        * (0.34 - 0.14 * np.sqrt(e_a))
+        * ((1.35 * r_surf / rad_s) - 0.35)
+    )
+    rad_n = rad_ns - rad_nl
+
+    # recommended for daily data
+    rho_s = 0.0
+    pet = (
+        0.408 * delta_v * (rad_n - rho_s) + gamma * 900.0 / (tmean + 273.0) * u_2m * e_def
+    ) / (delta_v + gamma * (1 + 0.34 * u_2m))
+    return pet.astype(dtype, copy=False)
+
+
+def _vapour_pressure(
+    tmax: np.ndarray, tmin: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute mean temperature and the saturation vapour pressure terms.
+
+    The saturation vapour pressure at mean, maximum, and minimum temperatures
+    are computed with a single ``np.exp`` call over the stacked temperatures.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Mean temperature [°C], slope of saturation vapour pressure [kPa/°C],
+        and saturation vapour pressure [kPa] at maximum and minimum temperatures.
+    """
+    temp = np.stack([0.5 * (tmax + tmin), tmax, tmin])
+    den = temp + 237.3
+    e_sat = 0.6108 * np.exp(17.27 * temp / den)
+    delta_v = 4098 * e_sat[0] / (den[0] * den[0])
+    return temp[0], delta_v, e_sat[1], e_sat[2]
+
+
+def _mean_kelvin4(tmax: np.ndarray, tmin: np.ndarray) -> np.ndarray:
+    """Compute the mean of the fourth powers of tmax and tmin in Kelvin."""
+    tmax_k = tmax + 273.16
+    tmax_k *= tmax_k
+    tmax_k *= tmax_k
+    tmin_k = tmin + 273.16
+    tmin_k *= tmin_k
+    tmin_k *= tmin_k
+    tmax_k += tmin_k
+    tmax_k *= 0.5
+    return tmax_k
+
+
+@functools.lru_cache(maxsize=1024)
+def _elevation_bycoords(coords: Tuple[Tuple[float, float], ...], crs: str) -> Tuple[float, ...]:
+    """Get elevation of a list of coordinates from 3DEP and cache the results.
+
+    The cache is in-memory only since ``joblib`` is not a dependency, and it
+    can be cleared with ``_elevation_bycoords.cache_clear()``.
+    """
+    import py3dep
+
+    return tuple(py3dep.elevation_bycoords(list(coords), crs, source="tnm"))
 
 
-def _check_requirements(reqs: Iterable, cols: List[str]) -> None:
+@functools.lru_cache(maxsize=1)
+def _cached_elevation_bygrid(
+    xs: bytes, ys: bytes, crs: str, res: float
+) -> Union[xr.DataArray, xr.Dataset]:
+    """Get elevation of a grid from 3DEP and cache the results of the last grid."""
+    import py3dep
+
+    return py3dep.elevation_bygrid(np.frombuffer(xs), np.frombuffer(ys), crs, res)
+
+
+def _elevation_bygrid(
+    xs: bytes, ys: bytes, crs: str, res: float
+) -> Union[xr.DataArray, xr.Dataset]:
+    """Get elevation of a grid from 3DEP using an in-memory cache of the last grid.
+
+    The x- and y-coordinates are passed as the raw bytes of float64 arrays,
+    which are cheaper to hash than tuples of floats. A copy of the cached grid
+    is returned, so callers can't modify the cached object.
+
+    There's no on-disk cache since ``joblib`` is not a dependency; the cache
+    only lives as long as the process. It can be cleared with
+    ``_cached_elevation_bygrid.cache_clear()``.
+    """
+    return _cached_elevation_bygrid(xs, ys, crs, res).copy()
+
+
+def _check_requirements(reqs: Iterable[str], cols: Iterable[str]) -> None:
     """Check for all the required data.
 
     Parameters
     ----------
     reqs : iterable
         A list of required data names (str)
-    cols : list
+    cols : iterable
         A list of variable names (str)
     """
-    if not isinstance(reqs, Iterable):
-        raise InvalidInputType("reqs", "iterable")
-
-    missing = [r for r in reqs if r not in cols]
+    cols_set = set(cols)
+    missing = [r for r in reqs if r not in cols_set]
     if missing:
         raise MissingItems(missing)
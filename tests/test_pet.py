@@ -0,0 +1,145 @@
+"""Offline tests for PET computations with synthetic climate data."""
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from pygeoogc import ServiceError
+
+import pydaymet as daymet
+from pydaymet import InvalidInputRange, InvalidInputType, InvalidInputValue, pet
+
+COORDS = (-70.0, 45.0)
+ELEV = 250.0
+SMALL = 1e-3
+
+
+def clm_df() -> pd.DataFrame:
+    dates = pd.date_range("2000-01-01", "2000-12-30")
+    cos = np.cos(2.0 * np.pi * np.arange(len(dates)) / 365.0)
+    return pd.DataFrame(
+        {
+            "tmin (degrees C)": 5.0 - 10.0 * cos,
+            "tmax (degrees C)": 15.0 - 10.0 * cos,
+            "srad (W/m2)": 250.0 - 100.0 * cos,
+            "dayl (s)": 43200.0 - 10000.0 * cos,
+        },
+        index=dates,
+    )
+
+
+def clm_ds() -> xr.Dataset:
+    time = pd.date_range("2000-06-01", periods=10)
+    y = np.array([3.0, 2.0, 1.0])
+    x = np.array([-2.0, -1.0, 0.0, 1.0])
+    shape = (time.size, y.size, x.size)
+    ramp = np.linspace(0.0, 1.0, np.prod(shape)).reshape(shape)
+    grid = ("time", "y", "x")
+    ds = xr.Dataset(
+        {
+            "tmin": (grid, (10.0 + 5.0 * ramp).astype("f4")),
+            "tmax": (grid, (20.0 + 8.0 * ramp).astype("f4")),
+            "srad": (grid, (300.0 + 50.0 * ramp).astype("f4")),
+            "dayl": (grid, (50000.0 + 2000.0 * ramp).astype("f4")),
+            "lat": (grid, np.broadcast_to((40.0 + y)[None, :, None], shape).astype("f4")),
+            "lon": (grid, np.broadcast_to((-100.0 + x)[None, None, :], shape).astype("f4")),
+        },
+        coords={"time": time, "y": y, "x": x},
+        attrs={"res": (1.0, -1.0), "crs": "epsg:4326"},
+    )
+    ds["tmin"][:, 0, 0] = np.nan
+    return ds
+
+
+@pytest.fixture
+def elev_bycoords(monkeypatch):
+    calls = []
+
+    def _elevation(coords, crs):
+        calls.append(coords)
+        return (ELEV,) * len(coords)
+
+    monkeypatch.setattr(pet, "_elevation_bycoords", _elevation)
+    return calls
+
+
+@pytest.fixture
+def elev_bygrid(monkeypatch):
+    def _elevation(xs, ys, crs, res):
+        xs, ys = np.frombuffer(xs), np.frombuffer(ys)
+        return xr.DataArray(
+            np.linspace(100.0, 1200.0, ys.size * xs.size).reshape(ys.size, xs.size),
+            dims=("y", "x"),
+            coords={"y": ys, "x": xs},
+            name="elevation",
+        )
+
+    monkeypatch.setattr(pet, "_elevation_bygrid", _elevation)
+
+
+class TestCoords:
+    def test_fao56(self, elev_bycoords):
+        clm = daymet.potential_et(clm_df(), COORDS)
+        assert abs(clm["pet (mm/day)"].mean() - 2.0992) < SMALL
+        assert np.allclose(clm["pet (mm/day)"].iloc[[0, 180]], [0.6951, 3.8851], atol=SMALL)
+        assert "tmean (deg c)" not in clm
+
+    def test_rh_u2(self, elev_bycoords):
+        df = clm_df()
+        df["rh (-)"] = 60.0
+        df["u2 (m/s)"] = 3.0
+        clm = daymet.potential_et(df, COORDS)
+        assert abs(clm["pet (mm/day)"].mean() - 2.5889) < SMALL
+
+
+class TestByCoords:
+    def test_single_request(self, elev_bycoords):
+        coords_list = [COORDS, (-71.0, 44.0)]
+        clm_list = daymet.potential_et_bycoords([clm_df(), clm_df()], coords_list)
+        assert len(elev_bycoords) == 1 and len(elev_bycoords[0]) == 2
+        for clm, coords in zip(clm_list, coords_list):
+            single = daymet.potential_et(clm_df(), coords, elevation=ELEV)
+            pd.testing.assert_series_equal(clm["pet (mm/day)"], single["pet (mm/day)"])
+
+    def test_elevation(self, elev_bycoords):
+        clm = daymet.potential_et(clm_df(), COORDS, elevation=ELEV)
+        assert not elev_bycoords
+        assert abs(clm["pet (mm/day)"].mean() - 2.0992) < SMALL
+
+    def test_mismatch(self, elev_bycoords):
+        with pytest.raises(InvalidInputRange) as ex:
+            daymet.potential_et_bycoords([clm_df()], [COORDS, COORDS])
+        assert "same length" in str(ex.value)
+
+    def test_empty(self, elev_bycoords):
+        assert daymet.potential_et_bycoords([], []) == []
+        assert not elev_bycoords
+
+    def test_invalid_before_request(self, elev_bycoords):
+        with pytest.raises(InvalidInputValue):
+            daymet.potential_et_bycoords([clm_df()], [COORDS], method="x")
+        with pytest.raises(InvalidInputType):
+            daymet.potential_et_bycoords([clm_ds()], [COORDS])
+        assert not elev_bycoords
+
+    def test_missing_elevation(self, monkeypatch):
+        monkeypatch.setattr(pet, "_elevation_bycoords", lambda coords, crs: (ELEV,))
+        with pytest.raises(ServiceError) as ex:
+            daymet.potential_et_bycoords([clm_df(), clm_df()], [COORDS, COORDS])
+        assert "1 elevations for 2" in str(ex.value)
+
+
+class TestGridded:
+    def test_fao56(self, elev_bygrid):
+        clm = daymet.potential_et(clm_ds())
+        pet_grid = clm.pet.transpose("time", "y", "x")
+        assert clm.pet.dtype == np.float64
+        assert abs(clm.pet.mean().item() - 3.6793) < SMALL
+        assert clm.pet.isnull().sum().item() == 10
+        assert np.allclose(pet_grid.values[[0, -1], [1, 2], [1, 3]], [3.0861, 4.3699], atol=SMALL)
+        assert np.issubdtype(clm.time.dtype, np.datetime64)
+
+    def test_chunked(self, elev_bygrid):
+        expected = daymet.potential_et(clm_ds()).pet
+        clm = daymet.potential_et(clm_ds().chunk({"time": 3, "y": 2}))
+        assert clm.pet.chunks is not None
+        xr.testing.assert_allclose(clm.pet.compute(), expected)
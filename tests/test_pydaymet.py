@@ -36,6 +36,11 @@ def test_byloc():
     )
 
 
+def test_mixed_format_dates():
+    dates = daymet.Daymet().dates_todict(("20000101", "2000-05-01 00:00"))
+    assert dates == {"start": "2000-01-01", "end": "2000-05-01"}
+
+
 class TestByCoords:
     def test_daily(self):
         clm = daymet.get_bycoords(COORDS, DATES, variables=VAR, crs=ALT_CRS)